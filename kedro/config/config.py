@@ -2,11 +2,51 @@
 or more configuration files from specified paths.
 """
 import logging
-from glob import iglob
+import mmap
+import os
+import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import AbstractSet, Any, Dict, Iterable, List, Set, Union
+from typing import Any, Dict, Iterable, List, Set, Union
 from warnings import warn
 
+import yaml
+from yaml.composer import Composer, ComposerError
+from yaml.constructor import SafeConstructor
+from yaml.resolver import Resolver
+
+try:
+    # use the C extension of the parser when libyaml is available,
+    # it is significantly faster than the pure-Python implementation
+    from yaml.cyaml import CParser
+
+    class _EventSafeLoader(CParser, Composer, SafeConstructor, Resolver):
+        """Safe loader backed by libyaml's event parser, with the
+        pure-Python composer on top so that top-level entries can be
+        composed and constructed one at a time.
+        """
+
+        def __init__(self, stream):
+            CParser.__init__(self, stream)
+            Composer.__init__(self)
+            SafeConstructor.__init__(self)
+            Resolver.__init__(self)
+
+
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _EventSafeLoader  # type: ignore
+
+try:
+    # orjson parses JSON several times faster than the stdlib
+    from orjson import loads as _json_loads
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover
+    from json import loads as _json_loads
+
+    _HAS_ORJSON = False
+
 SUPPORTED_EXTENSIONS = [
     ".yml",
     ".yaml",
@@ -17,6 +57,15 @@ SUPPORTED_EXTENSIONS = [
     ".xml",
 ]
 
+# FIFO cache of compiled glob patterns, so that repeated ``get()`` calls
+# with the same patterns do not recompile them
+_COMPILED_GLOBS = OrderedDict()  # type: OrderedDict[tuple, Any]
+_COMPILED_GLOBS_MAX = 32
+
+# minimum number of config files before loading them in parallel,
+# so that the pool overhead is not paid for trivial lookups
+_MIN_FILES_FOR_PARALLEL_LOAD = 4
+
 
 class MissingConfigException(Exception):
     """Raised when no configuration files can be found within a config path"""
@@ -104,6 +153,11 @@ class ConfigLoader:
         self.conf_paths = _remove_duplicates(conf_paths)
         self.logger = logging.getLogger(__name__)
 
+    @staticmethod
+    def clear_cache() -> None:
+        """Clear the cache of compiled glob patterns."""
+        _COMPILED_GLOBS.clear()
+
     @staticmethod
     def _load_config_file(config_file: Path) -> Dict[str, Any]:
         """Load an individual config file using `anyconfig` as a backend.
@@ -118,17 +172,22 @@ class ConfigLoader:
         Returns:
             Parsed configuration.
         """
-        # for performance reasons
-        import anyconfig  # pylint: disable=import-outside-toplevel
-
         try:
-            # Default to UTF-8, which is Python 3 default encoding, to decode the file
-            with open(config_file, encoding="utf8") as yml:
-                return {
-                    k: v
-                    for k, v in anyconfig.load(yml).items()
-                    if not k.startswith("_")
-                }
+            if config_file.suffix in (".yml", ".yaml"):
+                # slurp the file with a single read and parse from memory,
+                # instead of having the parser issue many small stream reads
+                return _load_yaml_filtered(config_file.read_text(encoding="utf8"))
+            if config_file.suffix == ".json":
+                loaded_config = _load_json(config_file)
+            else:
+                # for performance reasons
+                import anyconfig  # pylint: disable=import-outside-toplevel
+
+                # Default to UTF-8, which is Python 3 default encoding,
+                # to decode the file
+                with open(config_file, encoding="utf8") as conf:
+                    loaded_config = anyconfig.load(conf)
+            return {k: v for k, v in loaded_config.items() if not k.startswith("_")}
         except AttributeError as exc:
             raise BadConfigException(
                 f"Couldn't load config file: {config_file}"
@@ -152,12 +211,22 @@ class ConfigLoader:
         """
 
         aggregate_config = {}
-        seen_file_to_keys = {}  # type: Dict[Path, AbstractSet[str]]
+        seen_keys_to_file = {}  # type: Dict[str, Path]
 
-        for config_filepath in config_filepaths:
-            single_config = self._load_config_file(config_filepath)
-            _check_duplicate_keys(seen_file_to_keys, config_filepath, single_config)
-            seen_file_to_keys[config_filepath] = single_config.keys()
+        if len(config_filepaths) < _MIN_FILES_FOR_PARALLEL_LOAD:
+            single_configs = map(self._load_config_file, config_filepaths)
+        else:
+            # file reads release the GIL, so loading in parallel overlaps
+            # the I/O latency of the individual config files
+            with ThreadPoolExecutor(
+                max_workers=min(8, len(config_filepaths))
+            ) as executor:
+                single_configs = list(
+                    executor.map(self._load_config_file, config_filepaths)
+                )
+
+        for config_filepath, single_config in zip(config_filepaths, single_configs):
+            _check_duplicate_keys(seen_keys_to_file, config_filepath, single_config)
             aggregate_config.update(single_config)
 
         return aggregate_config
@@ -241,22 +310,144 @@ class ConfigLoader:
         return config
 
 
+def _load_json(config_file: Path) -> Any:
+    """Parse a JSON file. When orjson is available the file is
+    memory-mapped and handed to the parser as a zero-copy view, instead
+    of being copied into an intermediate string first; otherwise, or when
+    the file cannot be mapped (e.g. it is empty), it is read into memory.
+
+    Args:
+        config_file: Path to a JSON file to process.
+
+    Returns:
+        Parsed content of the file.
+
+    """
+    if _HAS_ORJSON:
+        with open(config_file, "rb") as json_file:
+            try:
+                buffer = mmap.mmap(json_file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):  # pragma: no cover
+                pass
+            else:
+                try:
+                    return _json_loads(memoryview(buffer))
+                finally:
+                    buffer.close()
+    return _json_loads(config_file.read_bytes())
+
+
+def _load_yaml_filtered(source: str) -> Dict[str, Any]:
+    """Parse a YAML document, dropping ``_``-prefixed top-level entries
+    while parsing instead of materializing them first and filtering
+    afterwards. Hidden entries are still composed, so anchors defined
+    inside them stay resolvable from the visible entries, but they are
+    never constructed into Python objects. Documents with a top-level
+    merge key (``<<``) are re-parsed eagerly, as flattening them needs
+    the whole mapping.
+
+    Args:
+        source: YAML document to parse.
+
+    Raises:
+        AttributeError: If the document is not a mapping at the top level.
+        yaml.composer.ComposerError: If the stream contains more than one
+            document, as ``yaml.safe_load`` raises.
+
+    Returns:
+        The parsed configuration without the hidden entries.
+
+    """
+    loader = _EventSafeLoader(source)
+    try:
+        loader.get_event()  # StreamStartEvent
+        if loader.check_event(yaml.StreamEndEvent):
+            data = None  # empty document
+        else:
+            loader.get_event()  # DocumentStartEvent
+            if loader.check_event(yaml.MappingStartEvent):
+                loader.get_event()
+                config = {}
+                while not loader.check_event(yaml.MappingEndEvent):
+                    key_node = loader.compose_node(None, None)
+                    if key_node.tag in (
+                        "tag:yaml.org,2002:merge",
+                        "tag:yaml.org,2002:value",
+                    ):
+                        # `<<`/`=` keys are resolved by flatten_mapping over
+                        # the whole mapping node, which the streaming path
+                        # cannot do; construct the document eagerly instead
+                        data = yaml.load(source, Loader=_EventSafeLoader)
+                        break
+                    key = loader.construct_object(key_node)
+                    value_node = loader.compose_node(key_node, None)
+                    if not key.startswith("_"):
+                        config[key] = loader.construct_object(value_node)
+                else:
+                    _finalize_construction(loader)
+                    loader.get_event()  # MappingEndEvent
+                    _reject_extra_documents(loader)
+                    return config
+            else:
+                data = loader.construct_object(loader.compose_node(None, None))
+                _finalize_construction(loader)
+                _reject_extra_documents(loader)
+        # not a mapping, or eagerly re-parsed; filter as the eager path did
+        return {k: v for k, v in data.items() if not k.startswith("_")}
+    finally:
+        loader.dispose()
+
+
+def _finalize_construction(loader) -> None:
+    """Drain the pending state generators so that recursive nodes end up
+    fully constructed, the way ``BaseConstructor.construct_document``
+    finalizes a document. Constructing with ``deep=True`` instead would
+    raise on self-referential anchors."""
+    while loader.state_generators:
+        state_generators = loader.state_generators
+        loader.state_generators = []
+        for generator in state_generators:
+            for _ in generator:
+                pass
+
+
+def _reject_extra_documents(loader) -> None:
+    """Consume the document end and raise if the stream holds another
+    document, mirroring ``Composer.get_single_node``."""
+    loader.get_event()  # DocumentEndEvent
+    if not loader.check_event(yaml.StreamEndEvent):
+        raise ComposerError(
+            "expected a single document in the stream",
+            None,
+            "but found another document",
+            loader.get_event().start_mark,
+        )
+
+
 def _check_duplicate_keys(
-    processed_files: Dict[Path, AbstractSet[str]], filepath: Path, conf: Dict[str, Any]
+    seen_keys_to_file: Dict[str, Path], filepath: Path, conf: Dict[str, Any]
 ) -> None:
-    duplicates = []
+    duplicates = {}  # type: Dict[Path, List[str]]
 
-    for processed_file, keys in processed_files.items():
-        overlapping_keys = conf.keys() & keys
+    for key in conf:
+        first_filepath = seen_keys_to_file.setdefault(key, filepath)
+        if first_filepath != filepath:
+            duplicates.setdefault(first_filepath, []).append(key)
 
-        if overlapping_keys:
-            sorted_keys = ", ".join(sorted(overlapping_keys))
+    if duplicates:
+        dup_messages = []
+        # report the clashing files in the order they were processed,
+        # as the previous pairwise implementation did
+        for processed_file in dict.fromkeys(seen_keys_to_file.values()):
+            keys = duplicates.get(processed_file)
+            if not keys:
+                continue
+            sorted_keys = ", ".join(sorted(keys))
             if len(sorted_keys) > 100:
                 sorted_keys = sorted_keys[:100] + "..."
-            duplicates.append(f"{processed_file}: {sorted_keys}")
+            dup_messages.append(f"{processed_file}: {sorted_keys}")
 
-    if duplicates:
-        dup_str = "\n- ".join(duplicates)
+        dup_str = "\n- ".join(dup_messages)
         raise ValueError(f"Duplicate keys found in {filepath} and:\n- {dup_str}")
 
 
@@ -273,24 +464,158 @@ def _path_lookup(conf_path: Path, patterns: Iterable[str]) -> Set[Path]:
 
     """
     config_files = set()
-    conf_path = conf_path.resolve()
-
-    for pattern in patterns:
-        # `Path.glob()` ignores the files if pattern ends with "**",
-        # therefore iglob is used instead
-        for each in iglob(str(conf_path / pattern), recursive=True):
-            path = Path(each).resolve()
-            if path.is_file() and path.suffix in SUPPORTED_EXTENSIONS:
+    # `os.path.realpath` skips the Path construction and re-parsing
+    # that `Path.resolve` pays for every canonicalised path
+    root = os.path.realpath(conf_path)
+    combined_pattern = _compile_globs(tuple(patterns))
+
+    for file_path in _walk_files(root):
+        # all walked paths are prefixed by ``root``, so a slice is enough
+        relative_path = file_path[len(root) + 1 :]
+        if os.sep != "/":  # pragma: no cover
+            relative_path = relative_path.replace(os.sep, "/")
+        if combined_pattern.match(relative_path):
+            path = Path(os.path.realpath(file_path))
+            if path.suffix in SUPPORTED_EXTENSIONS:
                 config_files.add(path)
 
     return config_files
 
 
+def _walk_files(root: str) -> Iterable[str]:
+    """Recursively yield the paths of all files under ``root``.
+    ``os.scandir`` is used instead of ``Path.rglob`` as ``DirEntry``
+    reuses the file type reported by the directory scan, avoiding one
+    stat call per entry. Hidden entries are walked too -- whether they
+    can match is decided by the translated pattern, as explicit
+    dot-prefixed pattern components do match hidden names.
+    As in ``glob``, unreadable or vanished entries are skipped silently,
+    and symlinked directories are not followed, so symlink cycles cannot
+    make the walk recurse forever.
+
+    Args:
+        root: Path to the directory to traverse.
+
+    Yields:
+        Paths of the files found under ``root``.
+
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_files(entry.path)
+            elif entry.is_file():
+                yield entry.path
+        except OSError:  # e.g. a broken symlink
+            continue
+
+
+def _compile_globs(patterns: tuple):
+    """Compile a tuple of glob patterns into a single alternation regular
+    expression, memoizing the result so that repeated ``get()`` calls with
+    the same patterns skip both the translation and the compilation. A
+    single combined match per file replaces one match per file per pattern.
+
+    Args:
+        patterns: Tuple of glob patterns to compile.
+
+    Returns:
+        The compiled regular expression matching any of ``patterns``.
+
+    """
+    compiled = _COMPILED_GLOBS.get(patterns)
+    if compiled is None:
+        compiled = re.compile(
+            "|".join(_translate_glob(pattern) for pattern in patterns)
+        )
+        _COMPILED_GLOBS[patterns] = compiled
+        if len(_COMPILED_GLOBS) > _COMPILED_GLOBS_MAX:
+            _COMPILED_GLOBS.popitem(last=False)
+    return compiled
+
+
+def _translate_glob(pattern: str) -> str:
+    """Translate a glob pattern into a regular expression matching paths
+    relative to a configuration directory. Character classes (``[seq]``,
+    ``[!seq]``) translate as in ``fnmatch.translate``, but unlike it,
+    ``*`` and ``?`` do not cross path separators. ``**`` matches any
+    number of path segments when it forms a whole path component, and
+    degrades to ``*`` when embedded inside one, exactly as
+    ``glob.glob(recursive=True)`` treats it. As in glob, a component
+    only matches a hidden (dot-prefixed) name when the component itself
+    starts with a literal dot.
+
+    Args:
+        pattern: Glob pattern to translate.
+
+    Returns:
+        The equivalent regular expression as a string.
+
+    """
+    parts = []
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char != "." and (index == 0 or pattern[index - 1] == "/"):
+            # hidden names only match pattern components that start
+            # with a literal dot
+            parts.append(r"(?!\.)")
+        if char == "*":
+            if (
+                pattern[index : index + 2] == "**"
+                and (index == 0 or pattern[index - 1] == "/")
+                and pattern[index + 2 : index + 3] in ("", "/")
+            ):
+                index += 2
+                if pattern[index : index + 1] == "/":
+                    # `**/` matches zero or more non-hidden directories
+                    parts.append(r"(?:(?!\.)[^/]+/)*")
+                    index += 1
+                else:
+                    # trailing `**` matches any run of non-hidden segments
+                    parts.append(r"[^/]*(?:/(?!\.)[^/]+)*")
+                continue
+            parts.append("[^/]*")
+        elif char == "?":
+            parts.append("[^/]")
+        elif char == "[":
+            # translate character classes the way `fnmatch.translate` does
+            end = index + 1
+            if end < len(pattern) and pattern[end] == "!":
+                end += 1
+            if end < len(pattern) and pattern[end] == "]":
+                end += 1
+            while end < len(pattern) and pattern[end] != "]":
+                end += 1
+            if end >= len(pattern):
+                parts.append(r"\[")  # unterminated class is a literal `[`
+            else:
+                stuff = pattern[index + 1 : end].replace("\\", r"\\")
+                if stuff[0] == "!":
+                    stuff = "^" + stuff[1:]
+                elif stuff[0] in ("^", "["):
+                    stuff = "\\" + stuff
+                parts.append(f"[{stuff}]")
+                index = end
+        else:
+            parts.append(re.escape(char))
+        index += 1
+    return "".join(parts) + r"\Z"
+
+
 def _remove_duplicates(items: Iterable[str]):
     """Remove duplicates while preserving the order."""
+    seen = set()  # type: Set[str]
     unique_items = []  # type: List[str]
     for item in items:
-        if item not in unique_items:
+        if item not in seen:
+            seen.add(item)
             unique_items.append(item)
         else:
             warn(
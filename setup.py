@@ -100,6 +100,7 @@ yaml_require = {"yaml.YAMLDataSet": [PANDAS, "PyYAML>=4.2, <6.0"]}
 extras_require = {
     "api": _collect_requirements(api_require),
     "biosequence": _collect_requirements(biosequence_require),
+    "config": ["orjson~=3.6"],
     "dask": _collect_requirements(dask_require),
     "docs": [
         "docutils==0.16",